@@ -4,28 +4,18 @@ PRISM CLI Dashboard - Interactive Configuration and Job Management
 """
 import os
 import sys
-import json
-import subprocess
-import copy
+import functools
+import heapq
+import io
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
+from typing import NamedTuple
 
 try:
-    import tomllib  # Python 3.11+
-except ImportError:  # pragma: no cover - fallback when tomllib missing
-    tomllib = None
-
-try:
-    import toml as toml_module  # External library fallback for older Python
-except ImportError:  # pragma: no cover - handled gracefully at runtime
-    toml_module = None
-
-try:
+    # Table, Panel, box and the TOML parsers are imported where used to keep startup light
     from rich.console import Console
-    from rich.panel import Panel
-    from rich.table import Table
     from rich.prompt import Prompt, Confirm
-    from rich import box
 except ImportError:
     print("Error: 'rich' library required. Install with: pip3 install rich")
     sys.exit(1)
@@ -356,117 +346,322 @@ SECTION_MAP = {
 }
 
 
+class ParamSpec(NamedTuple):
+    """Flattened parameter metadata, precomputed once from the TUNABLE_PARAMS literal."""
+    type: str
+    default: object
+    desc: str
+    hint: str
+    label: str
+    choices: tuple
+
+
 SECTION_PARAM_ORDER = {}
 PARAM_LOOKUP = {}
+CATEGORY_PARAMS = {}
 for category, params in TUNABLE_PARAMS.items():
     section = SECTION_MAP[category]
     order = SECTION_PARAM_ORDER.setdefault(section, [])
+    specs = []
     for param_name, info in params.items():
         if param_name not in order:
             order.append(param_name)
-        PARAM_LOOKUP[(section, param_name)] = info
+        spec = ParamSpec(
+            type=info["type"],
+            default=info["default"],
+            desc=info["desc"],
+            hint=info.get("hint", ""),
+            label=info.get("label", param_name.replace("_", " ")),
+            choices=tuple(info.get("choices", ())),
+        )
+        PARAM_LOOKUP[(section, param_name)] = spec
+        specs.append((param_name, spec))
+    CATEGORY_PARAMS[category] = tuple(specs)
+SECTION_PARAM_ORDER = {section: tuple(order) for section, order in SECTION_PARAM_ORDER.items()}
+SECTION_PARAM_SET = {section: frozenset(order) for section, order in SECTION_PARAM_ORDER.items()}
+# Read-only view of the same metadata; the raw literal dicts above are dropped
+TUNABLE_PARAMS = MappingProxyType({
+    category: MappingProxyType(dict(specs)) for category, specs in CATEGORY_PARAMS.items()
+})
+
+
+# Parsed TOML keyed by path -> (stat signature, data)
+_TOML_CACHE = {}
+# Merged base + global config keyed by both files' stat signatures
+_ACTIVE_CACHE = None
+
+
+def _stat_key(path: Path):
+    """Return (st_mtime_ns, st_size, st_ino) for path, or None if it does not exist.
+
+    The inode catches editors that save by renaming a new file into place
+    within the same mtime tick.
+    """
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+# Parser function picked on first use; the main menu never parses TOML
+_TOML_LOADS = None
+
+
+def _toml_loads_backend():
+    """Import the fastest available TOML parser and return its loads()."""
+    global _TOML_LOADS
+
+    if _TOML_LOADS is not None:
+        return _TOML_LOADS
+
+    try:
+        import rtoml  # Rust-backed parser, preferred when installed
+        _TOML_LOADS = rtoml.loads
+        return _TOML_LOADS
+    except ImportError:  # pragma: no cover - optional accelerator
+        pass
+
+    try:
+        import pytomlpp  # C++-backed parser, second choice
+        _TOML_LOADS = pytomlpp.loads
+        return _TOML_LOADS
+    except ImportError:  # pragma: no cover - optional accelerator
+        pass
+
+    try:
+        import tomllib  # Python 3.11+
+        _TOML_LOADS = tomllib.loads
+        return _TOML_LOADS
+    except ImportError:  # pragma: no cover - fallback when tomllib missing
+        pass
+
+    try:
+        import toml as toml_module  # External library fallback for older Python
+        _TOML_LOADS = toml_module.loads
+        return _TOML_LOADS
+    except ImportError:  # pragma: no cover - handled gracefully at runtime
+        pass
+
+    raise RuntimeError("No TOML parser available. Install the 'toml' package.")
+
+
+def _loads_toml(text: str) -> dict:
+    """Parse a TOML document with the fastest available parser."""
+    return _toml_loads_backend()(text)
+
+
+def _parse_toml(path: Path) -> dict:
+    """Parse TOML data from path."""
+    return _loads_toml(path.read_text(encoding="utf-8"))
 
 
 def _load_toml(path: Path) -> dict:
-    """Load TOML data from path with available parser."""
-    if not path.exists():
+    """Load TOML data from path, reusing the cached parse while the file is unchanged.
+
+    The returned dict is shared with the cache; callers must copy before mutating.
+    """
+    key = _stat_key(path)
+    if key is None:
+        _TOML_CACHE.pop(path, None)
         return {}
 
-    if tomllib is not None:
-        with open(path, "rb") as handle:
-            return tomllib.load(handle)
+    cached = _TOML_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
 
-    if toml_module is not None:
-        with open(path, "r", encoding="utf-8") as handle:
-            return toml_module.load(handle)
+    data = _parse_toml(path)
+    _TOML_CACHE[path] = (key, data)
+    return data
 
-    raise RuntimeError("No TOML parser available. Install the 'toml' package.")
+
+def _clone_config(data: dict) -> dict:
+    """Copy the dict structure of a parsed config; scalar leaves are shared."""
+    return {k: (_clone_config(v) if isinstance(v, dict) else v) for k, v in data.items()}
 
 
 def _deep_merge(base: dict, override: dict) -> None:
-    """Recursively merge override into base."""
+    """Merge override into base, one table level deep (the shape of our configs)."""
     for key, value in override.items():
-        if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-            _deep_merge(base[key], value)
+        current = base.get(key)
+        if isinstance(value, dict):
+            if isinstance(current, dict):
+                current.update(value)
+            else:
+                base[key] = dict(value)
         else:
             base[key] = value
 
 
 def load_active_config() -> dict:
-    """Return the merged configuration (base + global overrides)."""
+    """Return the merged configuration (base + global overrides).
+
+    The result is memoized until either file changes; treat it as read-only.
+    """
+    global _ACTIVE_CACHE
+
+    key = (_stat_key(BASE_CONFIG), _stat_key(GLOBAL_HYPER))
+    if _ACTIVE_CACHE is not None and _ACTIVE_CACHE[0] == key:
+        return _ACTIVE_CACHE[1]
+
     base_data = _load_toml(BASE_CONFIG)
     global_data = _load_toml(GLOBAL_HYPER)
 
-    merged = copy.deepcopy(base_data)
+    merged = _clone_config(base_data)
     _deep_merge(merged, global_data)
+    _ACTIVE_CACHE = (key, merged)
     return merged
 
 
+def _seed_config_cache(path: Path, data: dict) -> None:
+    """Record data as the parse of path, which was just written from it."""
+    global _ACTIVE_CACHE
+
+    _ACTIVE_CACHE = None
+    key = _stat_key(path)
+    if key is None:
+        _TOML_CACHE.pop(path, None)
+        return
+    # Empty tables are not written out, so they would not come back from a parse
+    written = {k: (dict(v) if isinstance(v, dict) else v) for k, v in data.items() if v != {}}
+    _TOML_CACHE[path] = (key, written)
+
+
 def load_global_config() -> dict:
     """Load the global overrides file."""
-    return copy.deepcopy(_load_toml(GLOBAL_HYPER))
+    return _clone_config(_load_toml(GLOBAL_HYPER))
+
+
+# Escapes for TOML basic strings: quote, backslash and control characters
+_TOML_ESCAPES = {code: f"\\u{code:04X}" for code in (*range(0x20), 0x7F)}
+_TOML_ESCAPES.update({
+    0x08: "\\b",
+    0x09: "\\t",
+    0x0A: "\\n",
+    0x0C: "\\f",
+    0x0D: "\\r",
+    0x22: '\\"',
+    0x5C: "\\\\",
+})
+TOML_ESCAPE_TABLE = str.maketrans(_TOML_ESCAPES)
+
+
+def _toml_string(value: str) -> str:
+    """Quote value as a TOML basic string."""
+    # Common case: nothing to escape, skip the translate pass entirely
+    if value.isprintable() and '"' not in value and "\\" not in value:
+        return f'"{value}"'
+    return f'"{value.translate(TOML_ESCAPE_TABLE)}"'
+
+
+def _format_toml_array(value) -> str:
+    return f"[{', '.join(_format_toml_value(item) for item in value)}]"
+
+
+# Exact-type formatters; one dict probe replaces the isinstance chain for config values
+_TOML_FORMATTERS = {
+    bool: lambda value: "true" if value else "false",
+    int: str,
+    float: str,
+    str: _toml_string,
+    list: _format_toml_array,
+    tuple: _format_toml_array,
+}
 
 
 def _format_toml_value(value):
+    formatter = _TOML_FORMATTERS.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+
+    # Subclasses and anything unexpected
     if isinstance(value, bool):
         return "true" if value else "false"
     if isinstance(value, (int, float)):
         return f"{value}"
-    return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        return _format_toml_array(value)
+    return _toml_string(str(value))
 
 
 def _iter_section_items(section: str, data: dict):
-    order = SECTION_PARAM_ORDER.get(section, [])
-    seen = set()
+    """Yield known keys in declaration order, then any unknown keys sorted."""
+    order = SECTION_PARAM_ORDER.get(section, ())
+    known = SECTION_PARAM_SET.get(section, frozenset())
     for key in order:
         if key in data:
-            seen.add(key)
-            yield key, data[key]
-    for key in sorted(data.keys()):
-        if key not in seen:
             yield key, data[key]
+    for key in sorted(k for k in data if k not in known):
+        yield key, data[key]
 
 
-def write_global_config(data: dict) -> None:
-    """Persist the global override configuration."""
-    GLOBAL_HYPER.parent.mkdir(parents=True, exist_ok=True)
-
-    lines = [
-        "# PRISM CLI Managed Overrides",
-        f"# Last updated: {datetime.now().isoformat()}",
-        "",
-    ]
+def _render_toml(sections: dict, header_lines) -> str:
+    """Render {section: {key: value}} as TOML; the "" section holds top-level keys."""
+    buf = io.StringIO()
+    write = buf.write
+    for line in header_lines:
+        write(f"{line}\n")
+    write("\n")
 
     # Top-level entries
-    top_level = {k: v for k, v in data.items() if not isinstance(v, dict)}
-    seen_top = set()
-    for key in SECTION_PARAM_ORDER.get("", []):
-        if key in top_level:
-            lines.append(f"{key} = {_format_toml_value(top_level[key])}")
-            seen_top.add(key)
-    for key in sorted(top_level.keys()):
-        if key not in seen_top:
-            lines.append(f"{key} = {_format_toml_value(top_level[key])}")
+    top_level = sections.get("", {})
+    for key, value in _iter_section_items("", top_level):
+        write(f"{key} = {_format_toml_value(value)}\n")
     if top_level:
-        lines.append("")
+        write("\n")
 
     section_order = [sec for sec in SECTION_PARAM_ORDER.keys() if sec]
-    extra_sections = [sec for sec in data.keys() if isinstance(data[sec], dict) and sec not in section_order]
-    for sec in sorted(extra_sections):
-        section_order.append(sec)
+    section_order.extend(sorted(sec for sec in sections if sec and sec not in SECTION_PARAM_ORDER))
 
     for section in section_order:
-        section_data = data.get(section, {})
+        section_data = sections.get(section)
         if not section_data:
             continue
-        lines.append(f"[{section}]")
+        write(f"[{section}]\n")
         for key, value in _iter_section_items(section, section_data):
-            lines.append(f"{key} = {_format_toml_value(value)}")
-        lines.append("")
+            write(f"{key} = {_format_toml_value(value)}\n")
+        write("\n")
+
+    return buf.getvalue().rstrip() + "\n"
 
-    contents = "\n".join(lines).rstrip() + "\n"
-    with open(GLOBAL_HYPER, "w", encoding="utf-8") as handle:
-        handle.write(contents)
+
+def _atomic_write_text(path: Path, contents: str) -> None:
+    """Write contents to path via a temp file and rename, so readers never see a partial file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "w", encoding="utf-8") as handle:
+            handle.write(contents)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_global_config(data: dict) -> None:
+    """Persist the global override configuration."""
+    GLOBAL_HYPER.parent.mkdir(parents=True, exist_ok=True)
+
+    sections = {"": {k: v for k, v in data.items() if not isinstance(v, dict)}}
+    sections.update((k, v) for k, v in data.items() if isinstance(v, dict))
+    contents = _render_toml(sections, (
+        "# PRISM CLI Managed Overrides",
+        f"# Last updated: {datetime.now().isoformat()}",
+    ))
+
+    _atomic_write_text(GLOBAL_HYPER, contents)
+    _seed_config_cache(GLOBAL_HYPER, data)
+
+
+def _apply_entry(config: dict, entry) -> None:
+    """Apply one {"section", "params"} update to an in-memory config."""
+    section = entry["section"]
+    params = entry["params"]
+
+    if section:
+        section_dict = config.setdefault(section, {})
+        section_dict.update(params)
+    else:
+        config.update(params)
 
 
 def apply_config_changes(entries):
@@ -474,27 +669,30 @@ def apply_config_changes(entries):
     config = load_global_config()
 
     for entry in entries:
-        section = entry["section"]
-        params = entry["params"]
-
-        if section:
-            section_dict = config.setdefault(section, {})
-            section_dict.update(params)
-        else:
-            config.update(params)
+        _apply_entry(config, entry)
 
     write_global_config(config)
 
 
+# Shared stand-in for a missing section, so lookups don't allocate a new {}
+_EMPTY_SECTION = MappingProxyType({})
+
+
 def get_current_value(active_config: dict, section: str, key: str, default):
     if section:
-        return active_config.get(section, {}).get(key, default)
+        return active_config.get(section, _EMPTY_SECTION).get(key, default)
     return active_config.get(key, default)
 
 
 BACK_SENTINEL = object()
 
 
+@functools.lru_cache(maxsize=64)
+def _choice_range(n):
+    """Return the menu choices "0".."n-1", shared between redraws."""
+    return tuple(str(i) for i in range(n))
+
+
 def _prompt_bool(label: str, current_value, default):
     default_bool = current_value if isinstance(current_value, bool) else bool(default)
     default_choice = "yes" if default_bool else "no"
@@ -553,9 +751,9 @@ def _prompt_choice(label: str, choices, current_value, default):
     return response
 
 
-def prompt_parameter_value(label: str, param_info: dict, current_value):
-    param_type = param_info["type"]
-    default = param_info["default"]
+def prompt_parameter_value(label: str, spec: ParamSpec, current_value):
+    param_type = spec.type
+    default = spec.default
 
     if param_type == "bool":
         return _prompt_bool(label, current_value, default)
@@ -564,86 +762,150 @@ def prompt_parameter_value(label: str, param_info: dict, current_value):
     if param_type == "float":
         return _prompt_float(label, current_value, default)
     if param_type == "choice":
-        return _prompt_choice(label, param_info["choices"], current_value, default)
+        return _prompt_choice(label, spec.choices, current_value, default)
 
     return current_value
 
 
+# ANSI home + erase for POSIX terminals; None on Windows or when stdout is not a TTY
+_CLEAR_SEQ = "\x1b[H\x1b[2J" if os.name != 'nt' and sys.stdout.isatty() else None
+
+
 def clear_screen():
     """Clear terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
-
+    if _CLEAR_SEQ is not None:
+        sys.stdout.write(_CLEAR_SEQ)
+        sys.stdout.flush()
+    elif os.name == 'nt':
+        console.clear()
+
+
+MAIN_MENU_OPTIONS = (
+    ("1", "Edit Active Config"),
+    ("2", "Create New Experiment"),
+    ("3", "Run Experiment"),
+    ("4", "View Running Jobs"),
+    ("5", "View Logs & Reports"),
+    ("6", "Quick Parameter Adjust"),
+    ("7", "Load Experiment Template"),
+    ("q", "Quit"),
+)
+MAIN_MENU_CHOICES = [key for key, _ in MAIN_MENU_OPTIONS]
+
+
+def _build_header_panel():
+    from rich.panel import Panel
 
-def show_header():
-    """Display CLI header"""
-    console.print(Panel.fit(
+    return Panel.fit(
         "[bold cyan]PRISM CLI Dashboard[/bold cyan]\n"
         "[dim]Interactive Configuration & Job Management[/dim]",
         border_style="cyan"
-    ))
+    )
 
 
-def main_menu():
-    """Display main menu and get user choice"""
-    clear_screen()
-    show_header()
+def _build_main_menu_table():
+    from rich import box
+    from rich.table import Table
 
     table = Table(show_header=False, box=box.SIMPLE)
     table.add_column("Option", style="cyan", width=4)
     table.add_column("Description", style="white")
+    for key, desc in MAIN_MENU_OPTIONS:
+        table.add_row(key, desc)
+    return table
+
+
+# Static renderables, built on first use and reprinted on every redraw
+_HEADER_PANEL = None
+_MAIN_MENU_TABLE = None
+
+
+def render_lines(lines):
+    """Print a screen's worth of markup lines in a single console call."""
+    console.print("\n".join(lines))
+
+
+def _header_panel():
+    global _HEADER_PANEL
+
+    if _HEADER_PANEL is None:
+        _HEADER_PANEL = _build_header_panel()
+    return _HEADER_PANEL
 
-    table.add_row("1", "Edit Active Config")
-    table.add_row("2", "Create New Experiment")
-    table.add_row("3", "Run Experiment")
-    table.add_row("4", "View Running Jobs")
-    table.add_row("5", "View Logs & Reports")
-    table.add_row("6", "Quick Parameter Adjust")
-    table.add_row("7", "Load Experiment Template")
-    table.add_row("q", "Quit")
 
-    console.print(table)
-    console.print()
+def show_header():
+    """Display CLI header"""
+    console.print(_header_panel())
+
+
+def main_menu():
+    """Display main menu and get user choice"""
+    global _MAIN_MENU_TABLE
+
+    if _MAIN_MENU_TABLE is None:
+        _MAIN_MENU_TABLE = _build_main_menu_table()
 
-    choice = Prompt.ask("Select option", choices=["1", "2", "3", "4", "5", "6", "7", "q"])
+    from rich.console import Group
+
+    clear_screen()
+    console.print(Group(_header_panel(), _MAIN_MENU_TABLE, ""))
+
+    choice = Prompt.ask("Select option", choices=MAIN_MENU_CHOICES)
     return choice
 
 
+CATEGORIES = tuple(TUNABLE_PARAMS)
+# Category picker lines, printed in one call per redraw
+_CATEGORY_MENU = (
+    "[bold]Select parameter category:[/bold]\n",
+    "[dim]Type 'back' inside a category to return here without saving.[/dim]\n",
+    *(f"{i}. {cat}" for i, cat in enumerate(CATEGORIES, 1)),
+    "0. Back to main menu",
+)
+
+
 def configure_parameters(for_experiment: bool = False):
     """Interactive parameter configuration."""
-    while True:
-        clear_screen()
-        show_header()
+    # Private copy: staged edits are applied to it before they reach disk
+    active_config = _clone_config(load_active_config())
+    # Category edits staged this session, written in a single save on the way out
+    pending = []
 
-        console.print("[bold]Select parameter category:[/bold]\n")
-        console.print("[dim]Type 'back' inside a category to return here without saving.[/dim]\n")
+    try:
+        while True:
+            clear_screen()
+            show_header()
 
-        categories = list(TUNABLE_PARAMS.keys())
-        for i, cat in enumerate(categories, 1):
-            console.print(f"{i}. {cat}")
-        console.print("0. Back to main menu")
+            render_lines(_CATEGORY_MENU)
 
-        choice = Prompt.ask("\nCategory", choices=[str(i) for i in range(len(categories) + 1)])
+            choice = Prompt.ask("\nCategory", choices=_choice_range(len(CATEGORIES) + 1))
 
-        if choice == "0":
-            return None
+            if choice == "0":
+                if not pending:
+                    return None
+                break
 
-        category = categories[int(choice) - 1]
-        active_config = load_active_config()
-        result = edit_category(category, active_config)
+            category = CATEGORIES[int(choice) - 1]
+            result = edit_category(category, active_config)
 
-        if result is None:
-            if for_experiment:
-                return None
-            continue
+            if result is None:
+                if for_experiment:
+                    return None
+                continue
 
-        if for_experiment:
-            return result
+            if for_experiment:
+                return result
 
-        apply_config_changes([result])
-        console.print("\n[green]✓ Updated configs/global_hyper.toml[/green]\n")
+            pending.append(result)
+            _apply_entry(active_config, result)
+            console.print(f"\n[green]✓ Staged {category} changes[/green]\n")
 
-        if not Confirm.ask("Edit another category", default=False):
-            break
+            if not Confirm.ask("Edit another category", default=False):
+                break
+    finally:
+        if pending:
+            apply_config_changes(pending)
+            console.print(f"\n[green]✓ Updated configs/global_hyper.toml ({len(pending)} category edit(s))[/green]")
 
     if not for_experiment:
         Prompt.ask("\nPress Enter to continue")
@@ -651,28 +913,27 @@ def configure_parameters(for_experiment: bool = False):
 
 def edit_category(category, active_config):
     """Edit all parameters in a category."""
-    params = TUNABLE_PARAMS[category]
     section = SECTION_MAP[category]
 
     edited = {}
 
     clear_screen()
     show_header()
-    console.print(f"[bold cyan]Editing: {category}[/bold cyan]\n")
-    console.print("[dim]Type 'back' at any prompt to return without saving changes.[/dim]\n")
+    console.print(
+        f"[bold cyan]Editing: {category}[/bold cyan]\n\n"
+        "[dim]Type 'back' at any prompt to return without saving changes.[/dim]\n"
+    )
 
-    for param_name, param_info in params.items():
-        desc = param_info["desc"]
-        current_value = get_current_value(active_config, section, param_name, param_info["default"])
-        label = param_info.get("label", param_name.replace("_", " "))
+    for param_name, spec in CATEGORY_PARAMS[category]:
+        current_value = get_current_value(active_config, section, param_name, spec.default)
+        label = spec.label
 
-        console.print(f"[yellow]{label}[/yellow]: {desc}")
-        console.print(f"[dim]Current: {current_value}[/dim]")
-        hint = param_info.get("hint")
-        if hint:
-            console.print(f"[dim]Hint: {hint}[/dim]")
+        lines = [f"[yellow]{label}[/yellow]: {spec.desc}", f"[dim]Current: {current_value}[/dim]"]
+        if spec.hint:
+            lines.append(f"[dim]Hint: {spec.hint}[/dim]")
+        render_lines(lines)
 
-        value = prompt_parameter_value(label, param_info, current_value)
+        value = prompt_parameter_value(label, spec, current_value)
         if value is BACK_SENTINEL:
             console.print("\n[yellow]Back pressed. No changes saved for this category.[/yellow]")
             return None
@@ -685,53 +946,26 @@ def edit_category(category, active_config):
 
 def save_to_toml(config_dict, output_file):
     """Save configuration to TOML file"""
-    lines = ["# PRISM Experiment Configuration", f"# Created: {datetime.now().isoformat()}", ""]
-
-    # Group by section
-    by_section = {}
+    # Group by section; a section configured twice keeps the latest values
+    sections = {}
     for entry in config_dict:
-        section = entry["section"]
-        if section not in by_section:
-            by_section[section] = []
-        by_section[section].extend(entry["params"].items())
-
-    # Write top-level (no section)
-    if "" in by_section:
-        for key, value in by_section[""]:
-            if isinstance(value, bool):
-                lines.append(f"{key} = {str(value).lower()}")
-            elif isinstance(value, str):
-                lines.append(f'{key} = "{value}"')
-            else:
-                lines.append(f"{key} = {value}")
-        lines.append("")
-        del by_section[""]
-
-    # Write sections
-    for section, params in by_section.items():
-        lines.append(f"[{section}]")
-        for key, value in params:
-            if isinstance(value, bool):
-                lines.append(f"{key} = {str(value).lower()}")
-            elif isinstance(value, str):
-                lines.append(f'{key} = "{value}"')
-            else:
-                lines.append(f"{key} = {value}")
-        lines.append("")
+        sections.setdefault(entry["section"], {}).update(entry["params"])
+    contents = _render_toml(sections, (
+        "# PRISM Experiment Configuration",
+        f"# Created: {datetime.now().isoformat()}",
+    ))
 
-    with open(output_file, 'w') as f:
-        f.write('\n'.join(lines))
+    _atomic_write_text(Path(output_file), contents)
 
     console.print(f"[green]✓ Saved to {output_file}[/green]")
 
-    # Validate TOML syntax
-    validator = REPO_ROOT / "tools" / "validate_toml.sh"
-    if validator.exists():
-        result = subprocess.run([str(validator), str(output_file)], capture_output=True, text=True)
-        if result.returncode != 0:
-            console.print(f"[yellow]⚠ TOML validation warning:[/yellow]\n{result.stderr}")
-        else:
-            console.print("[dim]✓ TOML syntax validated[/dim]")
+    # Validate TOML syntax in-process on what we just wrote
+    try:
+        _loads_toml(contents)
+    except ValueError as e:  # every backend's decode error subclasses ValueError
+        console.print(f"[yellow]⚠ TOML validation warning:[/yellow]\n{e}")
+    else:
+        console.print("[dim]✓ TOML syntax validated[/dim]")
 
 
 def create_experiment():
@@ -767,10 +1001,29 @@ def create_experiment():
     Prompt.ask("\nPress Enter to continue")
 
 
+# Override files that are not runnable experiments
+_EXP_EXCLUDE = frozenset({"experiment_template", "README"})
+# (OVERRIDES_DIR st_mtime_ns, exp_names, experiments) from the last scan
+_EXP_CACHE = None
+
+
 def list_experiments():
     """List available experiment files"""
-    experiments = sorted(OVERRIDES_DIR.glob("*.toml"))
-    exp_names = [exp.stem for exp in experiments if exp.stem not in ["experiment_template", "README"]]
+    global _EXP_CACHE
+
+    try:
+        dir_mtime = OVERRIDES_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
+        return [], []
+    if _EXP_CACHE is not None and _EXP_CACHE[0] == dir_mtime:
+        return _EXP_CACHE[1], _EXP_CACHE[2]
+
+    # scandir hands back dirent types inline, so is_file() needs no extra stat
+    with os.scandir(OVERRIDES_DIR) as it:
+        file_names = sorted(e.name for e in it if e.name.endswith(".toml") and e.is_file())
+    exp_names = [name[:-5] for name in file_names if name[:-5] not in _EXP_EXCLUDE]
+    experiments = [OVERRIDES_DIR / f"{name}.toml" for name in exp_names]
+    _EXP_CACHE = (dir_mtime, exp_names, experiments)
     return exp_names, experiments
 
 
@@ -788,12 +1041,12 @@ def run_experiment():
         Prompt.ask("\nPress Enter to continue")
         return
 
-    console.print("Available experiments:")
-    for i, name in enumerate(exp_names, 1):
-        console.print(f"{i}. {name}")
-    console.print("0. Cancel")
+    lines = ["Available experiments:"]
+    lines.extend(f"{i}. {name}" for i, name in enumerate(exp_names, 1))
+    lines.append("0. Cancel")
+    render_lines(lines)
 
-    choice = Prompt.ask("\nSelect experiment", choices=[str(i) for i in range(len(exp_names) + 1)])
+    choice = Prompt.ask("\nSelect experiment", choices=_choice_range(len(exp_names) + 1))
 
     if choice == "0":
         return
@@ -813,30 +1066,97 @@ def run_experiment():
     Prompt.ask("\nPress Enter to continue")
 
 
+TERMINAL_CACHE = Path.home() / ".cache" / "prism_cli" / "terminal"
+TERMINALS = ("gnome-terminal", "xterm", "konsole")
+# Resolved terminal emulator: None until probed, "" when none is installed
+_TERMINAL_LAUNCHER = None
+# Whether tmux is on PATH: None until probed
+_HAS_TMUX = None
+
+
+def _detect_terminal():
+    """Return the terminal emulator to launch jobs in, probing at most once."""
+    global _TERMINAL_LAUNCHER
+
+    import shutil
+
+    if _TERMINAL_LAUNCHER is not None:
+        return _TERMINAL_LAUNCHER
+
+    try:
+        cached = TERMINAL_CACHE.read_text(encoding="utf-8").strip()
+    except OSError:
+        cached = ""
+    if cached in TERMINALS:
+        _TERMINAL_LAUNCHER = cached
+        return cached
+
+    _TERMINAL_LAUNCHER = next((t for t in TERMINALS if shutil.which(t)), "")
+    if _TERMINAL_LAUNCHER:
+        try:
+            TERMINAL_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            TERMINAL_CACHE.write_text(_TERMINAL_LAUNCHER + "\n", encoding="utf-8")
+        except OSError:
+            pass
+    return _TERMINAL_LAUNCHER
+
+
+def _has_tmux():
+    """Return True if tmux is installed, probing PATH only once."""
+    global _HAS_TMUX
+
+    if _HAS_TMUX is None:
+        import shutil
+
+        _HAS_TMUX = shutil.which("tmux") is not None
+    return _HAS_TMUX
+
+
+def _forget_terminal():
+    """Drop a cached terminal choice that no longer launches."""
+    global _TERMINAL_LAUNCHER
+
+    _TERMINAL_LAUNCHER = None
+    try:
+        TERMINAL_CACHE.unlink()
+    except OSError:
+        pass
+
+
+def _terminal_argv(terminal, command, title):
+    shell_cmd = f"{command}; read -p 'Press Enter to close...'"
+    if terminal == "gnome-terminal":
+        return ["gnome-terminal", "--title", title, "--", "bash", "-c", shell_cmd]
+    title_flag = "-title" if terminal == "xterm" else "--title"
+    return [terminal, title_flag, title, "-e", f"bash -c \"{shell_cmd}\""]
+
+
 def launch_in_new_window(command, title="PRISM Job"):
     """Launch command in a new terminal window"""
-    # Try different terminals
-    terminals = [
-        ["gnome-terminal", "--title", title, "--", "bash", "-c", f"{command}; read -p 'Press Enter to close...'"],
-        ["xterm", "-title", title, "-e", f"bash -c \"{command}; read -p 'Press Enter to close...'\""],
-        ["konsole", "--title", title, "-e", f"bash -c \"{command}; read -p 'Press Enter to close...'\""],
-    ]
+    import subprocess
 
-    for term_cmd in terminals:
+    terminal = _detect_terminal()
+    tried = set()
+    while terminal and terminal not in tried:
+        tried.add(terminal)
         try:
-            subprocess.Popen(term_cmd, start_new_session=True)
+            subprocess.Popen(_terminal_argv(terminal, command, title), start_new_session=True)
             return True
         except FileNotFoundError:
-            continue
+            # Stale choice (e.g. a cache written on another host sharing $HOME):
+            # drop it and probe PATH again before giving up on a terminal window
+            _forget_terminal()
+            terminal = _detect_terminal()
 
     # Fallback: background process with tmux if available
-    try:
-        tmux_cmd = f"tmux new-window -n '{title}' '{command}'"
-        subprocess.run(tmux_cmd, shell=True, check=True)
-        console.print("[dim]Launched in tmux window[/dim]")
-        return True
-    except:
-        pass
+    if _has_tmux():
+        try:
+            tmux_cmd = f"tmux new-window -n '{title}' '{command}'"
+            subprocess.run(tmux_cmd, shell=True, check=True)
+            console.print("[dim]Launched in tmux window[/dim]")
+            return True
+        except (OSError, subprocess.CalledProcessError):
+            pass
 
     # Last resort: background process
     console.print("[yellow]Warning: Could not open new terminal. Running in background...[/yellow]")
@@ -845,8 +1165,73 @@ def launch_in_new_window(command, title="PRISM Job"):
     return False
 
 
+JOB_PATTERN = "world_record_dsjc1000"
+# Worker thread for discovery work that can overlap screen rendering
+_EXECUTOR = None
+
+
+def _background(fn, *args):
+    """Run fn on the shared worker thread and return its Future."""
+    global _EXECUTOR
+
+    if _EXECUTOR is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prism-cli")
+    return _EXECUTOR.submit(fn, *args)
+
+
+def _collect_jobs_pgrep():
+    """Fallback job lookup for systems without /proc."""
+    import subprocess
+
+    # One portable listing of PID + full command; pgrep -a means something else on BSD/macOS
+    result = subprocess.run(
+        ["ps", "-ax", "-o", "pid=,command="],
+        capture_output=True, text=True
+    )
+    own_pid = str(os.getpid())
+    jobs = []
+    for line in result.stdout.splitlines():
+        pid, _, cmd = line.strip().partition(" ")
+        if pid and pid != own_pid and JOB_PATTERN in cmd:
+            jobs.append((pid, cmd.strip()))
+    return jobs
+
+
+def _collect_jobs():
+    """Return (pid, command) pairs for running PRISM jobs."""
+    if not os.path.isdir("/proc/self"):
+        return _collect_jobs_pgrep()
+
+    # Read command lines straight from /proc: no fork/exec at all
+    pattern = JOB_PATTERN.encode()
+    own_pid = str(os.getpid())
+    jobs = []
+    with os.scandir("/proc") as it:
+        for entry in it:
+            if not entry.name.isdigit() or entry.name == own_pid:
+                continue
+            try:
+                with open(f"/proc/{entry.name}/cmdline", "rb") as handle:
+                    raw = handle.read()
+            except OSError:
+                continue  # exited mid-scan or not readable
+            if pattern in raw:
+                cmd = raw.rstrip(b"\0").replace(b"\0", b" ").decode(errors="replace")
+                jobs.append((entry.name, cmd))
+    jobs.sort(key=lambda job: int(job[0]))
+    return jobs
+
+
 def view_running_jobs():
     """Show running PRISM jobs"""
+    from rich.console import Group
+    from rich.table import Table
+
+    # Scan for jobs while the header is drawn
+    jobs_future = _background(_collect_jobs)
+
     clear_screen()
     show_header()
 
@@ -854,31 +1239,17 @@ def view_running_jobs():
 
     # Check for running world_record_dsjc1000 processes
     try:
-        result = subprocess.run(
-            ["pgrep", "-f", "world_record_dsjc1000"],
-            capture_output=True, text=True
-        )
-        pids = result.stdout.strip().split('\n') if result.stdout else []
-        pids = [p for p in pids if p]
+        jobs = jobs_future.result()
 
-        if pids:
+        if jobs:
             table = Table()
             table.add_column("PID", style="cyan")
             table.add_column("Command", style="white")
 
-            for pid in pids:
-                try:
-                    cmd_result = subprocess.run(
-                        ["ps", "-p", pid, "-o", "cmd="],
-                        capture_output=True, text=True
-                    )
-                    cmd = cmd_result.stdout.strip()
-                    table.add_row(pid, cmd[:80] + "..." if len(cmd) > 80 else cmd)
-                except:
-                    pass
-
-            console.print(table)
-            console.print(f"\n[green]Found {len(pids)} running job(s)[/green]")
+            for pid, cmd in jobs:
+                table.add_row(pid, cmd[:80] + "..." if len(cmd) > 80 else cmd)
+
+            console.print(Group(table, f"\n[green]Found {len(jobs)} running job(s)[/green]"))
         else:
             console.print("[yellow]No running jobs found[/yellow]")
     except Exception as e:
@@ -887,100 +1258,134 @@ def view_running_jobs():
     Prompt.ask("\nPress Enter to continue")
 
 
+def _recent_logs(limit=10):
+    """Return (DirEntry, stat_result) for the newest log files, statting each once."""
+    entries = []
+    try:
+        with os.scandir(LOGS_DIR) as it:
+            for e in it:
+                if not e.name.endswith(".log"):
+                    continue
+                try:
+                    if e.is_file():
+                        entries.append((e, e.stat()))
+                except OSError:
+                    continue  # rotated or deleted since scandir listed it
+    except OSError:
+        return []  # missing, unreadable or not a directory: nothing to list
+    return heapq.nlargest(limit, entries, key=lambda item: item[1].st_mtime_ns)
+
+
 def view_logs_and_reports():
     """View logs and generate reports"""
+    import subprocess
+
+    # List the logs directory while the header is drawn
+    logs_future = _background(_recent_logs)
+
     clear_screen()
     show_header()
 
     console.print("[bold]Logs & Reports[/bold]\n")
 
-    # List recent logs
-    logs = sorted(LOGS_DIR.glob("*.log"), key=os.path.getmtime, reverse=True)[:10]
+    try:
+        logs = logs_future.result()
+    except Exception as e:
+        console.print(f"[red]Error listing logs: {e}[/red]")
+        Prompt.ask("\nPress Enter to continue")
+        return
 
     if not logs:
         console.print("[yellow]No logs found[/yellow]")
         Prompt.ask("\nPress Enter to continue")
         return
 
-    console.print("Recent logs:")
-    for i, log in enumerate(logs, 1):
-        mtime = datetime.fromtimestamp(log.stat().st_mtime)
-        size_mb = log.stat().st_size / (1024 * 1024)
-        console.print(f"{i}. {log.name} ({size_mb:.1f}MB, {mtime.strftime('%Y-%m-%d %H:%M')})")
-    console.print("0. Back")
+    lines = ["Recent logs:"]
+    for i, (log, st) in enumerate(logs, 1):
+        mtime = datetime.fromtimestamp(st.st_mtime)
+        size_mb = st.st_size / (1024 * 1024)
+        lines.append(f"{i}. {log.name} ({size_mb:.1f}MB, {mtime.strftime('%Y-%m-%d %H:%M')})")
+    lines.append("0. Back")
+    render_lines(lines)
 
-    choice = Prompt.ask("\nSelect log to view/summarize", choices=[str(i) for i in range(len(logs) + 1)])
+    choice = Prompt.ask("\nSelect log to view/summarize", choices=_choice_range(len(logs) + 1))
 
     if choice == "0":
         return
 
-    log_file = logs[int(choice) - 1]
+    log_file = Path(logs[int(choice) - 1][0].path)
 
     # Summarize the log
     console.print(f"\n[cyan]Summarizing {log_file.name}...[/cyan]\n")
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["python3", "tools/summarize_wr_log.py", str(log_file)],
-            capture_output=True, text=True, cwd=REPO_ROOT
+            stdout=subprocess.PIPE, text=True, bufsize=1, cwd=REPO_ROOT
         )
-        console.print(result.stdout)
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
+    else:
+        # Echo the summary as it is produced instead of buffering all of it
+        with proc.stdout:
+            for line in proc.stdout:
+                console.out(line, end="")
+        # stderr is not captured: on failure it has already reached the terminal
+        if proc.wait() != 0:
+            console.print(f"[red]Summarizer exited with status {proc.returncode}[/red]")
 
     Prompt.ask("\nPress Enter to continue")
 
 
-def quick_adjust():
-    """Quick single-parameter adjustment"""
-    clear_screen()
-    show_header()
-
-    console.print("[bold]Quick Parameter Adjust[/bold]\n")
-    console.print("[dim]Common adjustments for quick experiments[/dim]\n")
-
-    active_config = load_active_config()
-    adjustments = [
+# (description, section, param, spec) for the quick-adjust menu, resolved at import
+QUICK_ADJUSTMENTS = tuple(
+    (desc, section, param, PARAM_LOOKUP[(section, param)])
+    for desc, section, param in (
         ("Target chromatic number", "", "target_chromatic"),
         ("Runtime (hours)", "", "max_runtime_hours"),
         ("Thermodynamic steps per temp", "thermo", "steps_per_temp"),
         ("TE vs Kuramoto weight", "transfer_entropy", "te_vs_kuramoto_weight"),
         ("ADP epsilon decay", "adp", "epsilon_decay"),
         ("GPU batch size", "gpu", "batch_size"),
+    )
+)
+
+
+def quick_adjust():
+    """Quick single-parameter adjustment"""
+    clear_screen()
+    show_header()
+
+    lines = [
+        "[bold]Quick Parameter Adjust[/bold]\n",
+        "[dim]Common adjustments for quick experiments[/dim]\n",
     ]
 
-    for i, (desc, section, param) in enumerate(adjustments, 1):
-        param_info = PARAM_LOOKUP.get((section, param), {})
-        default = param_info.get("default")
-        current_value = get_current_value(active_config, section, param, default)
-        console.print(f"{i}. {desc} (current: {current_value})")
-        hint = param_info.get("hint")
-        if hint:
-            console.print(f"   [dim]Hint: {hint}[/dim]")
-    console.print("0. Cancel")
+    active_config = load_active_config()
 
-    choice = Prompt.ask("\nSelect parameter", choices=[str(i) for i in range(len(adjustments) + 1)])
+    for i, (desc, section, param, spec) in enumerate(QUICK_ADJUSTMENTS, 1):
+        current_value = get_current_value(active_config, section, param, spec.default)
+        lines.append(f"{i}. {desc} (current: {current_value})")
+        if spec.hint:
+            lines.append(f"   [dim]Hint: {spec.hint}[/dim]")
+    lines.append("0. Cancel")
+    render_lines(lines)
 
-    if choice == "0":
-        return
+    choice = Prompt.ask("\nSelect parameter", choices=_choice_range(len(QUICK_ADJUSTMENTS) + 1))
 
-    desc, section, param = adjustments[int(choice) - 1]
-    param_info = PARAM_LOOKUP.get((section, param))
-    if not param_info:
-        console.print("[red]Unable to locate parameter metadata.[/red]")
-        Prompt.ask("\nPress Enter to continue")
+    if choice == "0":
         return
 
-    current_value = get_current_value(active_config, section, param, param_info.get("default"))
-    label = param_info.get("label", param.replace("_", " "))
+    desc, section, param, spec = QUICK_ADJUSTMENTS[int(choice) - 1]
+    current_value = get_current_value(active_config, section, param, spec.default)
+    label = spec.label
 
-    console.print(f"\n[bold]{desc}[/bold]")
-    console.print(f"Current value: [cyan]{current_value}[/cyan]")
-    hint = param_info.get("hint")
-    if hint:
-        console.print(f"[dim]Hint: {hint}[/dim]")
+    lines = [f"\n[bold]{desc}[/bold]", f"Current value: [cyan]{current_value}[/cyan]"]
+    if spec.hint:
+        lines.append(f"[dim]Hint: {spec.hint}[/dim]")
+    render_lines(lines)
 
-    value = prompt_parameter_value(label, param_info, current_value)
+    value = prompt_parameter_value(label, spec, current_value)
     if value is BACK_SENTINEL:
         console.print("\n[yellow]Back pressed. No quick adjust applied.[/yellow]")
         return
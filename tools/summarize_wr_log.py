@@ -1,20 +1,119 @@
 #!/usr/bin/env python3
-import argparse, csv, json, os, re, sys
+import argparse, csv, functools, glob, json, mmap, os, re, sys
+from concurrent.futures import ProcessPoolExecutor
 
-RE_INTERIM = re.compile(r'INTERIM RESULT:\s*colors\s*=\s*(\d+)\s*time\s*=\s*([\d.]+)\s*s', re.I)
-RE_IMPROVE = re.compile(r'\[IMPROVE\].*?(\d+)\s*(?:→|->)\s*(\d+)', re.U)
-RE_TIME = re.compile(r'time\s*=\s*([\d.]+)\s*s', re.I)
-RE_FINAL = re.compile(r'FINAL RESULT:\s*colors\s*=\s*(\d+).*?conflicts\s*=\s*(\d+).*?time\s*=\s*([\d.]+)\s*s', re.I)
-RE_TDA = re.compile(r'\bTDA\s*=\s*(true|false)\b', re.I)
-RE_TDA_GPU = re.compile(r'\bTDA\s*GPU\s*=\s*(true|false)\b', re.I)
-RE_TDA_ACCEL = re.compile(r'GPU-accelerated TDA', re.I)
+try:
+    import orjson  # optional, faster JSON output
+except ImportError:
+    orjson = None
+
+# Log markers are fixed-case; leaving out re.I keeps sre on its literal-prefix fast path.
+# Patterns are bytes so they run directly over the mmap'd log.
+RE_INTERIM = re.compile(rb'INTERIM RESULT:\s*colors\s*=\s*(\d+)\s*time\s*=\s*([\d.]+)\s*s')
+ARROW = '→'.encode('utf-8')  # matched as raw bytes; lines are never decoded to scan them
+RE_IMPROVE = re.compile(rb'\[IMPROVE\].*?(\d+)\s*' + ARROW + rb'\s*(\d+)')
+RE_IMPROVE_ASCII = re.compile(rb'\[IMPROVE\].*?(\d+)\s*->\s*(\d+)')
+RE_TIME = re.compile(rb'time\s*=\s*([\d.]+)\s*s')
+RE_FINAL = re.compile(rb'FINAL RESULT:\s*colors\s*=\s*(\d+).*?conflicts\s*=\s*(\d+).*?time\s*=\s*([\d.]+)\s*s')
+# "TDA = x" and "TDA GPU = x" in one pattern; group 1 is set for the GPU flag
+RE_TDA_ANY = re.compile(rb'\bTDA(\s*GPU)?\s*=\s*(true|false)\b')
+RE_TDA_ACCEL = re.compile(rb'GPU-accelerated TDA')
+RE_SEED = re.compile(r'seed_(\d+)')  # on the base config's file name
+# Any line worth looking at carries one of these literals
+MARKERS = (b'time', b'RESULT', b'IMPROVE', b'TDA')
+# Shortest text any pattern can match (RE_TIME's "time=0s"); shorter lines are skipped
+MIN_MATCH_LEN = len(b'time=0s')
+
+def map_log(f):
+    # Empty files and pipes can't be mapped; read those into memory instead
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        return f.read()
+
+def count_newlines(buf, start, end, chunk=1 << 20):
+    # Bounded slices so a long quiet stretch of log is never copied in one piece
+    n = 0
+    while start < end:
+        stop = min(start + chunk, end)
+        n += buf[start:stop].count(b'\n')
+        start = stop
+    return n
+
+def iter_marked_lines(buf, stop=None):
+    # Yield (line_no, line) for every line containing a marker, up to offset `stop` (a line
+    # end). Each marker is located with buf.find (memchr speed) rather than looping over lines
+    # in Python, and line numbers are counted only over the gaps between hits.
+    size = len(buf) if stop is None else stop
+    # Next offset of each marker; `size` once a marker is exhausted
+    nxt = [buf.find(m, 0, size) for m in MARKERS]
+    nxt = [p if p >= 0 else size for p in nxt]
+    line_no = 0
+    counted = 0
+    while True:
+        pos = min(nxt)
+        if pos >= size:
+            return
+        start = buf.rfind(b'\n', 0, pos) + 1
+        end = buf.find(b'\n', pos, size)
+        if end < 0:
+            end = size
+        line_no += count_newlines(buf, counted, start)
+        counted = start
+        yield line_no, buf[start:end]
+        for k, p in enumerate(nxt):
+            if p < end:
+                p = buf.find(MARKERS[k], end, size)
+                nxt[k] = p if p >= 0 else size
+
+def parse_interim(line):
+    # Partition fast path for the canonical "INTERIM RESULT: colors = N time = T s"; anything
+    # else falls back to RE_INTERIM. Returns (colors, time_s) or None, and raises ValueError
+    # on an unparseable time just as the regex path does.
+    c, sep, rest = line.partition(b'INTERIM RESULT: colors = ')[2].partition(b' time = ')
+    t, sep_s, _ = rest.partition(b' s')
+    if sep and sep_s and c.isdigit() and t and not t.strip(b'0123456789.'):
+        return int(c), float(t)
+    m = RE_INTERIM.search(line)
+    return (int(m.group(1)), float(m.group(2))) if m else None
+
+def final_entry(m, line_no):
+    try:
+        return {
+            "colors": int(m.group(1)),
+            "conflicts": int(m.group(2)),
+            "time_s": float(m.group(3)),
+            "line_no": line_no
+        }
+    except ValueError:
+        return None
+
+def last_final(buf):
+    # FINAL RESULT is printed as a run ends, so walk FINAL lines backwards from EOF (rfind, no
+    # per-line Python work) and take the last one that parses. The forward scan is bounded at
+    # that line, so the reported FINAL doesn't depend on how much output follows it.
+    # Returns (final, line_end); line_end is None when the log holds no FINAL line.
+    size = len(buf)
+    end = size
+    while True:
+        pos = buf.rfind(b'FINAL RESULT', 0, end)
+        if pos < 0:
+            return None, None
+        start = buf.rfind(b'\n', 0, pos) + 1
+        stop = buf.find(b'\n', pos)
+        if stop < 0:
+            stop = size
+        m = RE_FINAL.search(buf[start:stop])
+        if m:
+            return final_entry(m, count_newlines(buf, 0, start)), stop
+        end = start
 
 def infer_seed_profile(base_config: str):
     if not base_config:
         return None, None
     base = os.path.basename(base_config)
     seed = None
-    m = re.search(r'seed_(\d+)', base)
+    m = RE_SEED.search(base)
     if m:
         try:
             seed = int(m.group(1))
@@ -23,135 +122,155 @@ def infer_seed_profile(base_config: str):
     profile = 'aggr' if 'aggr' in base else 'regular'
     return seed, profile
 
-def parse_log(path):
-    try:
-        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"[summarize] failed to read log: {e}", file=sys.stderr)
-        sys.exit(2)
+def parse_log(path, scan_after_final=False, want_events=True):
+    # Map the log instead of reading it: pages come in as the scan reaches them.
+    # A log that can't be opened raises OSError; callers decide whether that is fatal.
+    with open(path, 'rb') as f:
+        data = map_log(f)
 
-    interim = []  # list of dicts: {colors, time_s, line_no}
-    improvements = []  # list: {old, new, time_s, line_no, text}
-    best_colors = None
+    # IMPROVE events are kept as parallel columns, and only when the caller wants them (JSON
+    # output); the per-event dicts are built once at the end. Interim results only feed the
+    # count, the first entry and the best, so none are kept.
+    imp_old, imp_new, imp_times, imp_lines, imp_text = [], [], [], [], []
+    improve_count = 0
+    last_improve_time = None
+    # Running min over INTERIM colors and IMPROVE targets; the sentinel saves a None test per hit
+    best_colors = sys.maxsize
     best_time = None
     first_interim = None
     last_time_seen = None
     interim_count = 0
-    final = None
     tda = None
     tda_gpu = None
 
-    for i, line in enumerate(lines):
-        m_time = RE_TIME.search(line)
-        if m_time:
-            try:
-                last_time_seen = float(m_time.group(1))
-            except ValueError:
-                pass
-
-        m_interim = RE_INTERIM.search(line)
-        if m_interim:
-            try:
-                c = int(m_interim.group(1)); t = float(m_interim.group(2))
-            except ValueError:
+    try:
+        # The run is over at FINAL RESULT; unless asked to, don't scan the shutdown noise after it
+        final, final_end = last_final(data)
+        for i, line in iter_marked_lines(data, None if scan_after_final else final_end):
+            if len(line) < MIN_MATCH_LEN:
                 continue
-            interim_count += 1
-            last_time_seen = t
-            entry = {"colors": c, "time_s": t, "line_no": i}
-            interim.append(entry)
-            if first_interim is None:
-                first_interim = entry
-            if best_colors is None or c < best_colors:
-                best_colors, best_time = c, t
-
-        m_impr = RE_IMPROVE.search(line)
-        if m_impr:
-            try:
-                old = int(m_impr.group(1)); new = int(m_impr.group(2))
-            except ValueError:
-                old = new = None
-            t = None
-            m_t2 = RE_TIME.search(line)
-            if m_t2:
+            line_time = None
+            m_time = RE_TIME.search(line) if b"time" in line else None
+            if m_time:
                 try:
-                    t = float(m_t2.group(1))
-                    last_time_seen = t
+                    line_time = last_time_seen = float(m_time.group(1))
                 except ValueError:
-                    t = None
-            if t is None:
-                t = last_time_seen
-            improvements.append({"old": old, "new": new, "time_s": t, "line_no": i, "text": line.strip()})
-            if new is not None and (best_colors is None or new < best_colors):
-                best_colors, best_time = new, t
-
-        m_final = RE_FINAL.search(line)
-        if m_final:
-            try:
-                final = {
-                    "colors": int(m_final.group(1)),
-                    "conflicts": int(m_final.group(2)),
-                    "time_s": float(m_final.group(3)),
-                    "line_no": i
-                }
-            except ValueError:
-                final = None
-
-        m_tda = RE_TDA.search(line)
-        if m_tda:
-            tda = (m_tda.group(1).lower() == 'true')
-        m_tda_gpu = RE_TDA_GPU.search(line)
-        if m_tda_gpu:
-            tda_gpu = (m_tda_gpu.group(1).lower() == 'true')
-        if RE_TDA_ACCEL.search(line):
-            tda = True
-            tda_gpu = True
+                    pass
 
-    last_improve_time = None
-    if improvements:
-        for ev in reversed(improvements):
-            if ev.get("time_s") is not None:
-                last_improve_time = ev["time_s"]
-                break
+            interim = None
+            if b"INTERIM RESULT" in line:
+                try:
+                    interim = parse_interim(line)
+                except ValueError:
+                    continue
+            if interim:
+                c, t = interim
+                interim_count += 1
+                last_time_seen = t
+                if first_interim is None:
+                    first_interim = {"colors": c, "time_s": t, "line_no": i}
+                if c < best_colors:
+                    best_colors, best_time = c, t
+
+            m_impr = None
+            if b"[IMPROVE]" in line:
+                m_impr = (RE_IMPROVE if ARROW in line else RE_IMPROVE_ASCII).search(line)
+            if m_impr:
+                # Both groups are \d+, so int() can't fail here
+                old = int(m_impr.group(1)); new = int(m_impr.group(2))
+                # The line's own time was already parsed above; fall back to the last one seen
+                if line_time is not None:
+                    t = last_time_seen = line_time
+                else:
+                    t = last_time_seen
+                if new < old:
+                    improve_count += 1
+                if t is not None:
+                    last_improve_time = t
+                if want_events:
+                    imp_old.append(old)
+                    imp_new.append(new)
+                    imp_times.append(t)
+                    imp_lines.append(i)
+                    imp_text.append(line.decode('utf-8', 'ignore').strip())
+                if new < best_colors:
+                    best_colors, best_time = new, t
+
+            if b"TDA" not in line:
+                continue
+            for m_tda in RE_TDA_ANY.finditer(line):
+                if m_tda.group(1):
+                    tda_gpu = (m_tda.group(2) == b'true')
+                else:
+                    tda = (m_tda.group(2) == b'true')
+            if RE_TDA_ACCEL.search(line):
+                tda = True
+                tda_gpu = True
+    finally:
+        if isinstance(data, mmap.mmap):
+            data.close()
 
     summary = {
         "first_interim": first_interim,
-        "best": {"colors": best_colors, "time_s": best_time} if best_colors is not None else None,
+        "best": {"colors": best_colors, "time_s": best_time} if best_colors != sys.maxsize else None,
         "interim_count": interim_count,
-        "improve_events": improvements,
-        "improve_count": sum(1 for ev in improvements if ev.get("new") is not None and ev.get("old") is not None and ev["new"] < ev["old"]),
+        "improve_events": [
+            {"old": o, "new": n, "time_s": t, "line_no": ln, "text": tx}
+            for o, n, t, ln, tx in zip(imp_old, imp_new, imp_times, imp_lines, imp_text)
+        ],
+        "improve_count": improve_count,
         "last_improve_time_s": last_improve_time,
         "final": final,
         "tda": tda,
         "tda_gpu": tda_gpu,
     }
+    if not want_events:
+        del summary["improve_events"]
     return summary
 
+def parse_log_or_error(path, **kwargs):
+    # Batch worker: returns (summary, None) or (None, error) so one unreadable log is
+    # skipped by the parent instead of taking down the whole pool
+    try:
+        return parse_log(path, **kwargs), None
+    except OSError as e:
+        return None, str(e)
+
+def batch_json_names(paths):
+    # Name each JSON after the log's path below the deepest directory all logs share, so
+    # runs/a/wr.log and runs/b/wr.log give a__wr.json and b__wr.json rather than one wr.json
+    full = [os.path.abspath(p) for p in paths]
+    root = os.path.commonpath([os.path.dirname(p) for p in full])
+    return [os.path.splitext(os.path.relpath(p, root))[0].replace(os.sep, "__") + ".json" for p in full]
+
+CSV_FIELDS = (
+    "seed","profile","base_config","log_file",
+    "first_colors","first_time_s","best_colors","best_time_s",
+    "improve_events","last_improve_time_s","tda","tda_gpu",
+    "interim_count","final_colors","final_conflicts","final_time_s"
+)
+
 def append_csv_row(csv_path, row):
-    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
-    exists = os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
-    fields = [
-        "seed","profile","base_config","log_file",
-        "first_colors","first_time_s","best_colors","best_time_s",
-        "improve_events","last_improve_time_s","tda","tda_gpu",
-        "interim_count","final_colors","final_conflicts","final_time_s"
-    ]
+    csv_dir = os.path.dirname(csv_path)
+    if csv_dir:
+        os.makedirs(csv_dir, exist_ok=True)
+    try:
+        exists = os.stat(csv_path).st_size > 0
+    except FileNotFoundError:
+        exists = False
     with open(csv_path, 'a', newline='') as f:
-        w = csv.DictWriter(f, fieldnames=fields)
+        w = csv.writer(f)
         if not exists:
-            w.writeheader()
-        w.writerow({k: row.get(k, "") for k in fields})
+            w.writerow(CSV_FIELDS)
+        w.writerow([row.get(k, "") for k in CSV_FIELDS])
 
-def main():
-    ap = argparse.ArgumentParser(description="Summarize DSJC1000 WR log into CSV/JSON.")
-    ap.add_argument("log", help="Path to log file")
-    ap.add_argument("--base-config", default="", help="Path to base config used (optional)")
-    ap.add_argument("--csv-append", default="", help="Append summary row to this CSV path")
-    ap.add_argument("--json-out", default="", help="Write detailed JSON summary to this path")
-    args = ap.parse_args()
+def dump_json(obj):
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
 
-    summary = parse_log(args.log)
-    seed, profile = infer_seed_profile(args.base_config)
+def report(log, summary, base_config, csv_append, json_out):
+    seed, profile = infer_seed_profile(base_config)
 
     first = summary["first_interim"] or {}
     best = summary["best"] or {}
@@ -160,8 +279,8 @@ def main():
     csv_row = {
         "seed": seed if seed is not None else "",
         "profile": profile or "",
-        "base_config": args.base_config,
-        "log_file": args.log,
+        "base_config": base_config,
+        "log_file": log,
         "first_colors": first.get("colors", ""),
         "first_time_s": first.get("time_s", ""),
         "best_colors": best.get("colors", ""),
@@ -178,9 +297,9 @@ def main():
 
     # Human-friendly print
     print("=== WR Log Summary ===")
-    print(f"log: {args.log}")
-    if args.base_config:
-        print(f"base_config: {args.base_config}")
+    print(f"log: {log}")
+    if base_config:
+        print(f"base_config: {base_config}")
     if seed is not None or profile:
         print(f"seed: {seed if seed is not None else 'unknown'} | profile: {profile or 'unknown'}")
     print(f"interim_count: {summary['interim_count']}")
@@ -194,22 +313,85 @@ def main():
     if final:
         print(f"final: colors={final.get('colors')} conflicts={final.get('conflicts')} time={final.get('time_s')}s")
 
-    if args.csv_append:
-        append_csv_row(args.csv_append, csv_row)
-        print(f"[summary] appended CSV row -> {args.csv_append}")
-    if args.json_out:
-        os.makedirs(os.path.dirname(args.json_out), exist_ok=True)
-        with open(args.json_out, 'w', encoding='utf-8') as jf:
-            json.dump({
-                "meta": {
-                    "log_file": args.log,
-                    "base_config": args.base_config,
-                    "seed": seed,
-                    "profile": profile
-                },
-                "summary": summary
-            }, jf, ensure_ascii=False, indent=2)
-        print(f"[summary] wrote JSON -> {args.json_out}")
+    if csv_append:
+        append_csv_row(csv_append, csv_row)
+        print(f"[summary] appended CSV row -> {csv_append}")
+    if json_out:
+        json_dir = os.path.dirname(json_out)
+        if json_dir:
+            os.makedirs(json_dir, exist_ok=True)
+        payload = dump_json({
+            "meta": {
+                "log_file": log,
+                "base_config": base_config,
+                "seed": seed,
+                "profile": profile
+            },
+            "summary": summary
+        })
+        with open(json_out, 'wb') as jf:
+            jf.write(payload)
+        print(f"[summary] wrote JSON -> {json_out}")
+
+def main():
+    ap = argparse.ArgumentParser(description="Summarize DSJC1000 WR log into CSV/JSON.")
+    ap.add_argument("log", nargs="?", help="Path to log file")
+    ap.add_argument("--glob", default="", help="Summarize every log matching this (quoted) pattern instead; "
+                                               "--json-out is then a directory")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes for --glob (default: CPU count)")
+    ap.add_argument("--base-config", default="", help="Path to base config used (optional; single log only)")
+    ap.add_argument("--csv-append", default="", help="Append summary row to this CSV path")
+    ap.add_argument("--json-out", default="", help="Write detailed JSON summary to this path")
+    ap.add_argument("--scan-after-final", action="store_true",
+                    help="Keep scanning past FINAL RESULT (e.g. for TDA/IMPROVE lines printed at shutdown)")
+    args = ap.parse_args()
+    if bool(args.log) == bool(args.glob):
+        ap.error("give either a log path or --glob")
+    if args.glob and args.base_config:
+        # seed/profile/base_config are per run; one value stamped on every row of a sweep is wrong
+        ap.error("--base-config describes a single run and can't be combined with --glob")
+
+    parse_opts = {"scan_after_final": args.scan_after_final, "want_events": bool(args.json_out)}
+    if not args.glob:
+        try:
+            summary = parse_log(args.log, **parse_opts)
+        except OSError as e:
+            print(f"[summarize] failed to read log: {e}", file=sys.stderr)
+            sys.exit(2)
+        report(args.log, summary, args.base_config, args.csv_append, args.json_out)
+        return
+
+    paths = sorted(p for p in glob.glob(args.glob, recursive=True) if os.path.isfile(p))
+    if not paths:
+        print(f"[summarize] no logs match {args.glob}", file=sys.stderr)
+        sys.exit(2)
+    json_names = batch_json_names(paths) if args.json_out else [""] * len(paths)
+    if args.json_out and len(set(json_names)) < len(json_names):
+        dupes = sorted({n for n in json_names if json_names.count(n) > 1})
+        print(f"[summarize] --json-out names collide for {', '.join(dupes)}; "
+              f"narrow --glob or run the logs separately", file=sys.stderr)
+        sys.exit(2)
+    # Logs are parsed in worker processes; printing and the CSV/JSON writes stay in this
+    # process, in path order, so rows are never interleaved.
+    parse = functools.partial(parse_log_or_error, **parse_opts)
+    jobs = min(args.jobs, len(paths))
+    failed = 0
+    ex = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        results = ex.map(parse, paths, chunksize=max(1, len(paths) // (jobs * 4))) if ex else map(parse, paths)
+        for log, json_name, (summary, err) in zip(paths, json_names, results):
+            if err is not None:
+                print(f"[summarize] skipping {log}: {err}", file=sys.stderr)
+                failed += 1
+                continue
+            json_out = os.path.join(args.json_out, json_name) if json_name else ""
+            report(log, summary, args.base_config, args.csv_append, json_out)
+    finally:
+        if ex:
+            ex.shutdown()
+    if failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file